@@ -1,13 +1,22 @@
 import contextlib
 import logging
+import math
 import os
+import queue
 import signal
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 import AppKit as _AppKit
+import objc
 from AppKit import (
+    NSApplicationDidChangeScreenParametersNotification,
     NSBackingStoreBuffered,
     NSColor,
+    NSDisableScreenUpdates,
+    NSEnableScreenUpdates,
     NSPanel,
     NSScreen,
     NSScreenSaverWindowLevel,
@@ -20,34 +29,133 @@ from AppKit import (
     NSWindowCollectionBehaviorFullScreenAuxiliary,
     NSWindowStyleMaskBorderless,
     NSWorkspace,
+    NSWorkspaceDidActivateApplicationNotification,
 )
-from Foundation import NSMakeRect
-from PyQt6.QtCore import QPropertyAnimation, QRect, QSettings, Qt, QTimer
-from PyQt6.QtGui import QAction, QColor, QIcon, QPainter, QPen
+from ApplicationServices import (
+    AXIsProcessTrusted,
+    AXObserverAddNotification,
+    AXObserverCreate,
+    AXObserverGetRunLoopSource,
+    AXObserverRemoveNotification,
+    AXUIElementCopyAttributeValue,
+    AXUIElementCopyMultipleAttributeValues,
+    AXUIElementCreateApplication,
+    AXUIElementSetMessagingTimeout,
+    AXValueGetValue,
+    kAXErrorSuccess,
+    kAXFocusedWindowAttribute,
+    kAXFocusedWindowChangedNotification,
+    kAXMainWindowChangedNotification,
+    kAXPositionAttribute,
+    kAXSizeAttribute,
+    kAXUIElementDestroyedNotification,
+    kAXValueCGPointType,
+    kAXValueCGSizeType,
+    kAXWindowMiniaturizedNotification,
+    kAXWindowMovedNotification,
+    kAXWindowResizedNotification,
+)
+from CoreFoundation import CFRunLoopAddSource, CFRunLoopGetMain, CFRunLoopRemoveSource, kCFRunLoopCommonModes
+from Foundation import (
+    NSActivityUserInitiatedAllowingIdleSystemSleep,
+    NSMakeRect,
+    NSNotificationCenter,
+    NSObject,
+    NSProcessInfo,
+)
+from PyQt6.QtCore import (
+    QObject,
+    QPropertyAnimation,
+    QRect,
+    QSettings,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QAction, QColor, QIcon, QPainter, QPixmap, QRegion
 from PyQt6.QtWidgets import QApplication, QColorDialog, QMenu, QSystemTrayIcon, QWidget
-from Quartz import CGWindowListCopyWindowInfo, kCGNullWindowID, kCGWindowListOptionOnScreenOnly
+from Quartz import (
+    CAShapeLayer,
+    CATransaction,
+    CGPathAddRect,
+    CGPathCreateMutable,
+    CGRectMake,
+    CGWindowListCopyWindowInfo,
+    CGWindowListCreateDescriptionFromArray,
+    kCAFillRuleEvenOdd,
+    kCGNullWindowID,
+    kCGWindowAlpha,
+    kCGWindowBounds,
+    kCGWindowIsOnscreen,
+    kCGWindowLayer,
+    kCGWindowListExcludeDesktopElements,
+    kCGWindowListOptionOnScreenOnly,
+    kCGWindowNumber,
+    kCGWindowOwnerPID,
+)
 
 DEBOUNCE_DELAY = 200
+# Bursts of AX notifications within this window (ms) trigger a single lookup
+AX_EVENT_COALESCE_DELAY = 30
+# Upper bound (ms) on how long a continuous stream of changes can postpone the border
+DEBOUNCE_MAX_WAIT = 1000
+# Only used when the Accessibility observer cannot be installed
+FALLBACK_POLL_INTERVAL = 100
+# (idle ticks, interval ms): the fallback poll slows down while nothing changes.
+# App switches still reset it immediately via the NSWorkspace activation observer.
+POLL_BACKOFF_STEPS = ((5, 200), (20, 500), (50, 1000), (200, 3000))
+# How long (seconds) a window lookup is reused for the same active PID
+WINDOW_CACHE_TTL = 0.05
+# Window shifts (px, centre to centre) small enough to follow without hiding the border
+JITTER_THRESHOLD = 4
 BLUR_HOLE_PADDING = 0
+# Longest (seconds) an AX query may wait on an unresponsive app before falling back to CGWindowList
+AX_MESSAGING_TIMEOUT = 0.25
+# Windows narrower or shorter than this (px) are tooltips/pop-ups, not the focused window
+MIN_WINDOW_SIZE = 50
+# Visible border thickness (px); matches the inner half of the former 8px centred pen
+BORDER_WIDTH = 4
 
 # Configure logging
 APP_NAME = "FocusView"
 ORG_NAME = "FocusView"
 LOG_DIR = os.path.expanduser(f"~/.logs/{APP_NAME}")
 LOG_FILE = os.path.join(LOG_DIR, f"{APP_NAME}.log")
+# Rotate the log instead of letting it grow for the lifetime of the login session
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 3
 
 # Default highlight color
 DEFAULT_HIGHLIGHT_COLOR = "#FF0000"
 
-os.makedirs(LOG_DIR, exist_ok=True)
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler(LOG_FILE)],
-)
+# Background thread that writes queued log records to disk; started by setup_logging()
+log_listener = None
 
-logger = logging.getLogger(__name__)
+
+def setup_logging():
+    """Route logging through a queue to a rotating log file.
+
+    Called from main() rather than at import time, so importing this module
+    does not create directories or open files.
+    """
+    global log_listener
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    # Records are queued on the calling thread and written to disk by a background listener
+    log_queue = queue.Queue(-1)
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True)
+    log_listener = QueueListener(log_queue, file_handler)
+    log_listener.start()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
 
 
 def _qt_union_geometry():
@@ -55,11 +163,10 @@ def _qt_union_geometry():
     if not screens:
         return QRect(0, 0, 0, 0)
 
-    min_x = min(s.geometry().x() for s in screens)
-    min_y = min(s.geometry().y() for s in screens)
-    max_x = max(s.geometry().x() + s.geometry().width() for s in screens)
-    max_y = max(s.geometry().y() + s.geometry().height() for s in screens)
-    return QRect(min_x, min_y, max_x - min_x, max_y - min_y)
+    union = QRect()
+    for screen in screens:
+        union = union.united(screen.geometry())
+    return union
 
 
 def _ns_union_frame():
@@ -115,6 +222,14 @@ def _choose_blur_window_level():
     return NSScreenSaverWindowLevel
 
 
+# Resolved once; every blur panel uses the same values
+_VFX_MATERIAL = _choose_visual_effect_material()
+_BLUR_WINDOW_LEVEL = _choose_blur_window_level()
+_NON_ACTIVATING_MASK = getattr(_AppKit, "NSWindowStyleMaskNonactivatingPanel", 0)
+# Very light black tint behind the blur
+_TINT_CGCOLOR = NSColor.blackColor().colorWithAlphaComponent_(0.05).CGColor()
+
+
 class _QtToCocoaMapper:
     """Best-effort conversion between Qt global coords and Cocoa global coords.
 
@@ -129,36 +244,49 @@ class _QtToCocoaMapper:
         self.qt_union = _qt_union_geometry()
         self.ns_union = _ns_union_frame()
 
-    def qt_rect_to_ns_rect(self, rect: QRect):
+        # The mapping is constant until the screen layout changes, so fold it once.
         qt_u = self.qt_union
-        ns_left, ns_bottom, _, _ = self.ns_union
+        self._ns_left, self._ns_bottom, _, _ = self.ns_union
+        self._qt_x = qt_u.x()
+        self._qt_union_bottom = qt_u.y() + qt_u.height()
 
+    def qt_rect_to_ns_rect(self, rect: QRect):
         # Map X linearly.
-        ns_x = ns_left + float(rect.x() - qt_u.x())
+        ns_x = self._ns_left + float(rect.x() - self._qt_x)
 
         # Flip Y around the union's bottom edge in Qt space.
-        qt_union_bottom = qt_u.y() + qt_u.height()
-        ns_y = ns_bottom + float(qt_union_bottom - rect.y() - rect.height())
+        ns_y = self._ns_bottom + float(self._qt_union_bottom - rect.y() - rect.height())
 
         return NSMakeRect(ns_x, ns_y, float(rect.width()), float(rect.height()))
 
 
 class NativeBlurOverlayGroup:
+    """Blurs one screen except for a hole around the focused window.
+
+    A single full-screen panel hosts the blur; the hole is an even-odd
+    CAShapeLayer mask, so focus changes only swap the mask path.
+    """
+
     def __init__(self):
         self._mapper = _QtToCocoaMapper()
-        self._panels = [self._create_panel() for _ in range(4)]
+        self._mask_layer = CAShapeLayer.layer()
+        self._mask_layer.setFillRule_(kCAFillRuleEvenOdd)
+        self._panel = self._create_panel()
+        # Screen rect last mapped to Cocoa coordinates, and the mapped frame
+        self._screen_key = None
+        self._ns_frame = None
+        # Last panel frame and mask (size, hole) applied, to skip redundant Cocoa calls
+        self._last_frame = None
+        self._last_mask = None
 
     def _create_panel(self):
         rect = NSMakeRect(0, 0, 10, 10)
-        style_mask = NSWindowStyleMaskBorderless
-        non_activating = getattr(_AppKit, "NSWindowStyleMaskNonactivatingPanel", None)
-        if non_activating is not None:
-            style_mask |= non_activating
+        style_mask = NSWindowStyleMaskBorderless | _NON_ACTIVATING_MASK
 
         panel = NSPanel.alloc().initWithContentRect_styleMask_backing_defer_(
             rect, style_mask, NSBackingStoreBuffered, False
         )
-        panel.setLevel_(_choose_blur_window_level())
+        panel.setLevel_(_BLUR_WINDOW_LEVEL)
         panel.setOpaque_(False)
         panel.setBackgroundColor_(NSColor.clearColor())
         panel.setHasShadow_(False)
@@ -177,32 +305,33 @@ class NativeBlurOverlayGroup:
         effect_view.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)
         effect_view.setState_(NSVisualEffectStateActive)
         effect_view.setBlendingMode_(NSVisualEffectBlendingModeBehindWindow)
-        effect_view.setMaterial_(_choose_visual_effect_material())
-
-        # Some macOS/PyObjC combinations can make NSVisualEffectView appear "too subtle".
-        # Provide a tiny translucent backdrop so users can confirm the overlay is present.
-        # (This still allows the blur to show through when supported.)
-        try:
-            effect_view.setWantsLayer_(True)
-            layer = effect_view.layer()
-            if layer is not None:
-                # Very light black tint.
-                layer.setBackgroundColor_(_AppKit.NSColor.blackColor().colorWithAlphaComponent_(0.05).CGColor())
-        except Exception as exc:
-            logger.debug("Failed to set NSVisualEffectView layer background tint: %s", exc)
+        effect_view.setMaterial_(_VFX_MATERIAL)
+
+        effect_view.setWantsLayer_(True)
+        layer = effect_view.layer()
+        if layer is not None:
+            # Some macOS/PyObjC combinations can make NSVisualEffectView appear "too subtle".
+            # Provide a tiny translucent backdrop so users can confirm the overlay is present.
+            # (This still allows the blur to show through when supported.)
+            layer.setBackgroundColor_(_TINT_CGCOLOR)
+            # The focus hole is cut out of the blur by an even-odd mask path.
+            layer.setMask_(self._mask_layer)
 
         panel.setContentView_(effect_view)
         panel.orderOut_(None)
         return panel
 
+    def refresh_mapper(self):
+        self._mapper = _QtToCocoaMapper()
+        self._screen_key = None
+        self._last_frame = None
+
     def hide(self):
-        for p in self._panels:
-            p.orderOut_(None)
+        self._panel.orderOut_(None)
 
     def close(self):
-        for p in self._panels:
-            with contextlib.suppress(Exception):
-                p.close()
+        with contextlib.suppress(Exception):
+            self._panel.close()
 
     def show_outside_rect(self, screen_rect: QRect, focus_rect: QRect):
         """Show blur in the area of screen_rect excluding focus_rect."""
@@ -210,128 +339,568 @@ class NativeBlurOverlayGroup:
             self.hide()
             return
 
-        focus = focus_rect.intersected(screen_rect)
-        if focus.isNull() or focus.width() <= 0 or focus.height() <= 0:
-            # No overlap: blur the whole screen.
-            regions = [screen_rect]
-        else:
-            sx, sy, sw, sh = screen_rect.x(), screen_rect.y(), screen_rect.width(), screen_rect.height()
-            fx, fy, fw, fh = focus.x(), focus.y(), focus.width(), focus.height()
+        # The screen rarely changes, so only map it to Cocoa coordinates when it does.
+        screen_key = screen_rect.getRect()
+        if screen_key != self._screen_key:
+            self._ns_frame = self._mapper.qt_rect_to_ns_rect(screen_rect)
+            self._screen_key = screen_key
+
+        hole = _hole_in_screen(screen_key, focus_rect.getRect())
+
+        # Commit the frame and mask to the window server in a single update.
+        NSDisableScreenUpdates()
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        try:
+            self._apply(screen_key, hole)
+        finally:
+            CATransaction.commit()
+            NSEnableScreenUpdates()
+
+    def _apply(self, screen_key, hole):
+        width, height = screen_key[2], screen_key[3]
+        mask_key = (width, height, hole)
+        if screen_key == self._last_frame and mask_key == self._last_mask and self._panel.isVisible():
+            return
+
+        if screen_key != self._last_frame:
+            # A pure move does not need the content redrawn, only a resize does.
+            size_changed = self._last_frame is None or screen_key[2:] != self._last_frame[2:]
+            self._panel.setFrame_display_(self._ns_frame, size_changed)
+            self._mask_layer.setFrame_(CGRectMake(0, 0, width, height))
+            self._last_frame = screen_key
+
+        if mask_key != self._last_mask:
+            path = CGPathCreateMutable()
+            CGPathAddRect(path, None, CGRectMake(0, 0, width, height))
+            if hole is not None:
+                CGPathAddRect(path, None, CGRectMake(*hole))
+            self._mask_layer.setPath_(path)
+            self._last_mask = mask_key
+
+        self._panel.orderFrontRegardless()
+
+
+def _hole_in_screen(screen, focus):
+    """Intersect two (x, y, w, h) Qt rects and return it in the screen's bottom-left local coords.
+
+    Returns None when they do not overlap, meaning the whole screen is blurred.
+    """
+    sx, sy, sw, sh = screen
+    fx, fy, fw, fh = focus
+    left, right = max(sx, fx), min(sx + sw, fx + fw)
+    top, bottom = max(sy, fy), min(sy + sh, fy + fh)
+    if right <= left or bottom <= top:
+        return None
+    return (left - sx, sy + sh - bottom, right - left, bottom - top)
+
+
+def _native_blur_available():
+    return NSVisualEffectView.alloc().init() is not None
+
+
+def _configure_overlay_window(widget):
+    """Make a Qt overlay a click-through, non-activating, always-on-top tool window."""
+    widget.setWindowFlags(
+        Qt.WindowType.FramelessWindowHint
+        | Qt.WindowType.WindowStaysOnTopHint
+        | Qt.WindowType.Tool
+        | Qt.WindowType.WindowTransparentForInput
+    )
+    widget.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+    widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+    widget.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+    # Tool windows hide when their app is inactive, which FocusView almost always is
+    widget.setAttribute(Qt.WidgetAttribute.WA_MacAlwaysShowToolWindow)
+
+
+class QtBlurOverlay(QWidget):
+    """Fallback for NativeBlurOverlayGroup when NSVisualEffectView is unavailable.
+
+    A single translucent widget covers the screen and is masked to exclude the
+    focus rect, so the compositor blends one surface per screen.
+    """
 
-            top_h = fy - sy
-            bottom_y = fy + fh
-            bottom_h = (sy + sh) - bottom_y
-            left_w = fx - sx
-            right_x = fx + fw
-            right_w = (sx + sw) - right_x
+    def __init__(self):
+        super().__init__()
+        self._fill = QColor(0, 0, 0, 90)
+        self._last_key = None
+        _configure_overlay_window(self)
 
-            regions = [
-                QRect(sx, sy, sw, top_h),
-                QRect(sx, bottom_y, sw, bottom_h),
-                QRect(sx, fy, left_w, fh),
-                QRect(right_x, fy, right_w, fh),
-            ]
+    def refresh_mapper(self):
+        # Qt coordinates are used as-is; only force the mask to be rebuilt.
+        self._last_key = None
 
-        # Ensure exactly 4 panels worth of regions.
-        padded = regions[:4] + [QRect(0, 0, 0, 0)] * max(0, 4 - len(regions))
+    def show_outside_rect(self, screen_rect: QRect, focus_rect: QRect):
+        """Show the overlay in the area of screen_rect excluding focus_rect."""
+        if screen_rect.isNull() or focus_rect.isNull():
+            self.hide()
+            return
 
-        for panel, region in zip(self._panels, padded):
-            if region.isNull() or region.width() <= 0 or region.height() <= 0:
-                panel.orderOut_(None)
-                continue
+        key = (screen_rect.getRect(), focus_rect.getRect())
+        if key != self._last_key:
+            self.setGeometry(screen_rect)
+            hole = QRegion(focus_rect.translated(-screen_rect.topLeft()))
+            self.setMask(QRegion(self.rect()).subtracted(hole))
+            self._last_key = key
+        self.show()
 
-            ns_rect = self._mapper.qt_rect_to_ns_rect(region)
-            panel.setFrame_display_(ns_rect, True)
-            panel.orderFrontRegardless()
+    def paintEvent(self, event):
+        # Solid fill with baked-in alpha; only the damaged area needs repainting
+        QPainter(self).fillRect(event.rect(), self._fill)
 
 
 class BorderOverlay(QWidget):
-    def __init__(self, geometry, highlight_color="#FF0000"):
+    def __init__(self, geometry, highlight_color: QColor):
         super().__init__()
         self.highlight_color = highlight_color
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        _configure_overlay_window(self)
         self.setGeometry(geometry)
-
-    def set_highlight_color(self, color):
+        # Reused for every fade instead of allocating a new animation each time.
+        # Parented to the overlay so Qt owns it and frees it with the widget.
+        self.fade_animation = QPropertyAnimation(self, b"windowOpacity", self)
+        self.fade_animation.setDuration(500)
+        self.fade_animation.valueChanged.connect(self._repaint_if_skipped)
+        self._paint_skipped = False
+
+    def _repaint_if_skipped(self, opacity):
+        # Changing window opacity does not trigger a paint on its own
+        if self._paint_skipped and opacity >= 0.02:
+            self._paint_skipped = False
+            self.update()
+
+    def hideEvent(self, event):
+        # The border is hidden instantly on focus changes; don't keep animating an invisible window
+        self.fade_animation.stop()
+        super().hideEvent(event)
+
+    def set_highlight_color(self, color: QColor):
         self.highlight_color = color
         self.update()
 
+    def resizeEvent(self, event):
+        # Only the border ring is composited; the interior is not part of the window.
+        outer = QRegion(self.rect())
+        inner = QRegion(self.rect().adjusted(BORDER_WIDTH, BORDER_WIDTH, -BORDER_WIDTH, -BORDER_WIDTH))
+        self.setMask(outer.subtracted(inner))
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
+        # Invisible frames at the start of the fade-in; repainted once opacity rises.
+        if self.windowOpacity() < 0.02:
+            self._paint_skipped = True
+            return
+
+        # Four solid strips hit QPainter's fast fill path instead of stroking a wide pen.
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(QPen(QColor(self.highlight_color), 8))
-        painter.drawRect(self.rect())
+        width, height = self.width(), self.height()
+        painter.fillRect(0, 0, width, BORDER_WIDTH, self.highlight_color)
+        painter.fillRect(0, height - BORDER_WIDTH, width, BORDER_WIDTH, self.highlight_color)
+        painter.fillRect(0, 0, BORDER_WIDTH, height, self.highlight_color)
+        painter.fillRect(width - BORDER_WIDTH, 0, BORDER_WIDTH, height, self.highlight_color)
 
 
-def get_active_window_geometry():
+# (timestamp, pid, geometry) of the last window lookup
+_window_cache = (0.0, None, None)
+
+# Window chosen for each PID by the last full window list scan
+_pid_to_wid_cache = {}
+
+# Bumped on every invalidation so a lookup already running on the poller
+# thread cannot store a result that predates the invalidation.
+_cache_generation = 0
+
+# Held across the generation check and the cache stores on the poller thread, and
+# across invalidations on the UI thread, so neither can interleave with the other.
+_cache_lock = threading.Lock()
+
+# PID of the frontmost app, kept current by the NSWorkspace activation observer.
+# None until the first activation is seen; lookups then ask NSWorkspace directly.
+_active_pid = None
+
+
+def set_active_pid(pid):
+    global _active_pid
+    _active_pid = pid
+
+
+def _frontmost_pid():
+    if _active_pid is not None:
+        return _active_pid
+
     active_app_info = NSWorkspace.sharedWorkspace().activeApplication()
     if not active_app_info:
-        logger.info("No active application found.")
+        logger.debug("No active application found.")
         return None
+    return active_app_info.get("NSApplicationProcessIdentifier")
 
-    pid = active_app_info.get("NSApplicationProcessIdentifier")
-    if pid is None:
-        logger.info("No PID found for active application.")
+
+def invalidate_window_cache():
+    global _window_cache, _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _window_cache = (0.0, None, None)
+
+
+def forget_window_ids():
+    """Drop the PID -> window mapping, e.g. when a different window may now be focused."""
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _pid_to_wid_cache.clear()
+
+
+def _window_geometry(window):
+    # Skip windows that are not on the standard layer (0)
+    if window.get(kCGWindowLayer, 0) != 0:
+        return None
+
+    # Skip windows that are fully transparent
+    if window.get(kCGWindowAlpha, 1.0) == 0:
+        return None
+
+    bounds = window[kCGWindowBounds]
+    width = bounds["Width"]
+    height = bounds["Height"]
+    # Skip windows that are too small (e.g., tooltips, pop-ups)
+    if width < MIN_WINDOW_SIZE or height < MIN_WINDOW_SIZE:
+        return None
+    return (int(bounds["X"]), int(bounds["Y"]), int(width), int(height))
+
+
+_AX_FRAME_ATTRIBUTES = [kAXPositionAttribute, kAXSizeAttribute]
+
+
+def _ax_attribute(element, attribute):
+    err, value = AXUIElementCopyAttributeValue(element, attribute, None)
+    if err != kAXErrorSuccess:
+        return None
+    return value
+
+
+def _ax_application(pid):
+    # The default AX timeout is 6s; a hung app would stall every lookup behind it
+    app_element = AXUIElementCreateApplication(pid)
+    AXUIElementSetMessagingTimeout(app_element, AX_MESSAGING_TIMEOUT)
+    return app_element
+
+
+def _ax_focused_window(app_element):
+    window = _ax_attribute(app_element, kAXFocusedWindowAttribute)
+    if window is not None:
+        # Timeouts are per element, so the window needs its own
+        AXUIElementSetMessagingTimeout(window, AX_MESSAGING_TIMEOUT)
+    return window
+
+
+def _ax_window_geometry(pid):
+    """Read the app's focused window frame directly via Accessibility.
+
+    Returns None when Accessibility is unavailable for this app, or the app does
+    not answer within AX_MESSAGING_TIMEOUT, so the caller can fall back to the
+    CGWindowList lookup.
+    """
+    window = _ax_focused_window(_ax_application(pid))
+    if window is None:
         return None
 
-    window_list = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID)
+    # Position and size in one round trip to the target app
+    err, values = AXUIElementCopyMultipleAttributeValues(window, _AX_FRAME_ATTRIBUTES, 0, None)
+    if err != kAXErrorSuccess or values is None or len(values) != 2:
+        return None
+
+    # A failed attribute comes back as an error AXValue, which AXValueGetValue rejects
+    position, size = values
+    has_point, point = AXValueGetValue(position, kAXValueCGPointType, None)
+    has_size, extent = AXValueGetValue(size, kAXValueCGSizeType, None)
+    if not has_point or not has_size:
+        return None
+    if extent.width < MIN_WINDOW_SIZE or extent.height < MIN_WINDOW_SIZE:
+        return None
+    return (int(point.x), int(point.y), int(extent.width), int(extent.height))
+
+
+def _cached_window_geometry(pid):
+    wid = _pid_to_wid_cache.get(pid)
+    if wid is None:
+        return None
+
+    # Describes just this one window instead of copying the whole window list
+    descriptions = CGWindowListCreateDescriptionFromArray([wid])
+    window = descriptions[0] if descriptions else None
+    geometry = None
+    if window is not None and window.get(kCGWindowOwnerPID) == pid and window.get(kCGWindowIsOnscreen):
+        geometry = _window_geometry(window)
+    if geometry is None:
+        logger.debug("Cached window %s for pid %s is gone, rescanning", wid, pid)
+        _pid_to_wid_cache.pop(pid, None)
+    return geometry
+
+
+def _find_window_geometry(pid):
+    window_list = CGWindowListCopyWindowInfo(
+        kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements, kCGNullWindowID
+    )
     if not window_list:
-        logger.info("No windows found in window list.")
+        logger.debug("No windows found in window list.")
         return None
 
     for window in window_list:
-        if window.get("kCGWindowOwnerPID") == pid:
-            # Skip windows that are not on the standard layer (0)
-            if window.get("kCGWindowLayer", 0) != 0:
-                continue
-
-            # Skip windows that are fully transparent
-            if window.get("kCGWindowAlpha", 1.0) == 0:
-                continue
-
-            bounds = window.get("kCGWindowBounds")
-            # Skip windows that are too small (e.g., tooltips, pop-ups)
-            if bounds["Width"] < 50 or bounds["Height"] < 50:
-                continue
-            return {
-                "x": int(bounds["X"]),
-                "y": int(bounds["Y"]),
-                "width": int(bounds["Width"]),
-                "height": int(bounds["Height"]),
-            }
+        # Reject menu bar, Dock and other non-normal layers, then other applications' windows
+        if window.get(kCGWindowLayer, 0) != 0 or window.get(kCGWindowOwnerPID) != pid:
+            continue
+
+        geometry = _window_geometry(window)
+        if geometry is not None:
+            return window.get(kCGWindowNumber), geometry
 
     return None
 
 
+def get_active_window_geometry():
+    """Return the active window's (x, y, width, height) in global Qt coordinates, or None."""
+    global _window_cache
+    pid = _frontmost_pid()
+    if pid is None:
+        logger.debug("No PID found for active application.")
+        return None
+
+    cached_at, cached_pid, cached_geometry = _window_cache
+    if pid == cached_pid and time.monotonic() - cached_at < WINDOW_CACHE_TTL:
+        return cached_geometry
+
+    generation = _cache_generation
+    geometry = _ax_window_geometry(pid) or _cached_window_geometry(pid)
+    wid = None
+    if geometry is None:
+        found = _find_window_geometry(pid)
+        if found is not None:
+            wid, geometry = found
+
+    with _cache_lock:
+        if generation == _cache_generation:
+            if wid is not None:
+                _pid_to_wid_cache[pid] = wid
+            _window_cache = (time.monotonic(), pid, geometry)
+    return geometry
+
+
+class GeometryPoller(QObject):
+    """Runs get_active_window_geometry on a worker thread.
+
+    Emit `requested` from the UI thread; the result arrives via `geometry_ready`.
+    """
+
+    requested = pyqtSignal()
+    geometry_ready = pyqtSignal(object)
+
+    @pyqtSlot()
+    def poll(self):
+        # Worker threads have no AppKit-managed autorelease pool
+        with objc.autorelease_pool():
+            geometry = get_active_window_geometry()
+        self.geometry_ready.emit(geometry)
+
+
+def _geometry_center(geometry):
+    x, y, width, height = geometry
+    return x + width // 2, y + height // 2
+
+
+def check_accessibility():
+    """Return True if FocusView has been granted Accessibility permissions."""
+    trusted = bool(AXIsProcessTrusted())
+    if not trusted:
+        logger.warning(
+            "Accessibility permissions not granted. Enable FocusView in "
+            "System Settings > Privacy & Security > Accessibility for event-driven updates."
+        )
+    return trusted
+
+
+class _NotificationObserver(NSObject):
+    """Forwards Cocoa notifications to a Python callback via the handleNotification: selector."""
+
+    def initWithCallback_(self, callback):
+        self = objc.super(_NotificationObserver, self).init()
+        if self is None:
+            return None
+        self._callback = callback
+        return self
+
+    def handleNotification_(self, notification):
+        self._callback(notification)
+
+
+class _AXWindowObserver:
+    """Watches the windows of a single application for focus, move, resize, minimize and close events.
+
+    Close is observed on the focused window only and follows focus changes.
+
+    Requires Accessibility permissions. bind() returns False when the observer
+    could not be installed so the caller can fall back to polling.
+    """
+
+    NOTIFICATIONS = (
+        kAXFocusedWindowChangedNotification,
+        kAXMainWindowChangedNotification,
+        kAXWindowMiniaturizedNotification,
+        kAXWindowMovedNotification,
+        kAXWindowResizedNotification,
+    )
+    # After these the destroy notification is moved to the newly focused window
+    RETARGET_NOTIFICATIONS = (
+        kAXFocusedWindowChangedNotification,
+        kAXMainWindowChangedNotification,
+    )
+    # Notifications after which the focused window may be a different window (or none).
+    # Closing an app's last window raises no focus or activation change, only the destroy.
+    FOCUS_NOTIFICATIONS = (
+        kAXFocusedWindowChangedNotification,
+        kAXMainWindowChangedNotification,
+        kAXUIElementDestroyedNotification,
+        kAXWindowMiniaturizedNotification,
+    )
+
+    def __init__(self, on_change):
+        self._on_change = on_change
+        self._pid = None
+        self._observer = None
+        self._source = None
+        self._app_element = None
+        # Focused window carrying the destroy notification
+        self._window = None
+
+        @objc.callbackFor(AXObserverCreate)
+        def callback(observer, element, notification, refcon):
+            # Run loop sources fire outside AppKit's per-event pool; drain per callback
+            with objc.autorelease_pool():
+                if notification == kAXUIElementDestroyedNotification:
+                    # The element is gone, so there is nothing to unregister from
+                    self._window = None
+                    self._watch_focused_window()
+                elif notification in self.RETARGET_NOTIFICATIONS:
+                    self._watch_focused_window()
+                self._on_change(notification)
+
+        # Keep a reference so the bridged callback outlives AXObserverCreate.
+        self._callback = callback
+
+    def bind(self, pid):
+        if pid == self._pid and self._observer is not None:
+            return True
+
+        self.unbind()
+        err, observer = AXObserverCreate(pid, self._callback, None)
+        if err != kAXErrorSuccess or observer is None:
+            logger.warning("AXObserverCreate failed for pid %s (error %s)", pid, err)
+            return False
+
+        app_element = _ax_application(pid)
+        registered = 0
+        for name in self.NOTIFICATIONS:
+            err = AXObserverAddNotification(observer, app_element, name, None)
+            if err == kAXErrorSuccess:
+                registered += 1
+            else:
+                logger.debug("Failed to observe %s for pid %s (error %s)", name, pid, err)
+        if not registered:
+            logger.warning("No window notifications available for pid %s", pid)
+            return False
+
+        self._source = AXObserverGetRunLoopSource(observer)
+        CFRunLoopAddSource(CFRunLoopGetMain(), self._source, kCFRunLoopCommonModes)
+        self._observer = observer
+        self._pid = pid
+        self._app_element = app_element
+        self._watch_focused_window()
+        logger.debug("Observing window events for pid %s", pid)
+        return True
+
+    def _watch_focused_window(self):
+        # Registered on the window itself: on the app element, the destroy notification
+        # fires for every menu item, row or tooltip the app tears down.
+        if self._window is not None:
+            AXObserverRemoveNotification(self._observer, self._window, kAXUIElementDestroyedNotification)
+        self._window = _ax_focused_window(self._app_element)
+        if self._window is None:
+            return
+
+        err = AXObserverAddNotification(self._observer, self._window, kAXUIElementDestroyedNotification, None)
+        if err != kAXErrorSuccess:
+            logger.debug("Failed to observe focused window destruction for pid %s (error %s)", self._pid, err)
+            self._window = None
+
+    def unbind(self):
+        if self._source is not None:
+            CFRunLoopRemoveSource(CFRunLoopGetMain(), self._source, kCFRunLoopCommonModes)
+        self._source = None
+        self._observer = None
+        self._pid = None
+        self._app_element = None
+        self._window = None
+
+
 class FocusViewApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.app.setOrganizationName(ORG_NAME)
         self.app.setApplicationName(APP_NAME)
-        self.screen_overlays = {}
+        # One border overlay follows the focused window across screens
+        self.border_overlay = None
         self.blur_overlays = {}
+        # (screen, geometry) pairs, refreshed only when screens are added or removed
+        self._screens = []
+        # availableGeometry() per screen, read by show_blur on every focus change
+        self._available_geometries = {}
+        # Entry of _screens that matched the previous screen_at() lookup
+        self._last_screen = None
+        # Tray icons by highlight color, so switching colors back and forth is free
+        self._icon_cache: dict[str, QIcon] = {}
+        # Single scratch pixmap the icons are painted from
+        self._tray_pixmap = None
+        # Created on first use and reused for every later colour pick
+        self._color_dialog = None
 
         # Load settings
         self.settings = QSettings()
-        self.highlight_color = self.settings.value("highlight_color", DEFAULT_HIGHLIGHT_COLOR)
+        # Parsed once; the hex string is only used when reading/writing settings
+        self.highlight_qcolor = QColor(self.settings.value("highlight_color", DEFAULT_HIGHLIGHT_COLOR))
         self.blur_enabled = self.settings.value("blur_enabled", True, type=bool)
 
-        # Timer for polling window position
+        # Fallback timer for polling window position when AX events are unavailable
         self.poll_timer = QTimer()
         # Timer to delay showing the border after a move/resize
         self.debounce_timer = QTimer()
-        self.last_active_rect = None
-        self.animation = None  # Holds a reference to the current animation
+        # Collapses a burst of AX window notifications into one lookup
+        self.ax_event_timer = QTimer()
+        self._idle_ticks = 0
+        self._debounce_started_at = 0.0
+        # (x, y, width, height) of the focused window, compared cheaply on every event
+        self.last_active_geometry = None
 
         self.setup_signal_handler()
+        self.setup_app_nap_activity()
         self.setup_overlays()
         self.setup_timers()
+        self.setup_geometry_poller()
+        self.setup_window_observers()
         self.setup_system_tray()
 
         # Prevent app from exiting when the color picker (or last window) is closed
         self.app.setQuitOnLastWindowClosed(False)
+        # Quits that do not go through quit_app (e.g. logout) still need cleanup
+        self._cleaned_up = False
+        self.app.aboutToQuit.connect(self.cleanup)
+
+    def setup_app_nap_activity(self):
+        # FocusView has no visible windows most of the time, which makes it an App Nap
+        # candidate; napping would delay AX callbacks and the fallback poll timer.
+        # Idle system sleep stays allowed.
+        self.app_nap_activity = NSProcessInfo.processInfo().beginActivityWithOptions_reason_(
+            NSActivityUserInitiatedAllowingIdleSystemSleep,
+            "FocusView must respond promptly to window focus changes",
+        )
 
     def setup_signal_handler(self):
         signal.signal(signal.SIGINT, self.handle_signal)
@@ -342,21 +911,89 @@ class FocusViewApp:
         sys.exit(0)
 
     def setup_overlays(self):
+        self.native_blur = _native_blur_available()
+        if not self.native_blur:
+            logger.warning("NSVisualEffectView unavailable, using Qt overlay for blur")
+
+        self.border_overlay = BorderOverlay(QRect(), self.highlight_qcolor)
         for screen in QApplication.screens():
-            border_overlay = BorderOverlay(screen.geometry(), self.highlight_color)
-            self.screen_overlays[screen] = border_overlay
-            self.blur_overlays[screen] = NativeBlurOverlayGroup()
+            self.blur_overlays[screen] = self.create_blur_overlay()
+            self.watch_screen(screen)
+
+        self.refresh_screens()
+        self.app.screenAdded.connect(self.handle_screen_added)
+        self.app.screenRemoved.connect(self.handle_screen_removed)
+        self.app.primaryScreenChanged.connect(self.handle_screens_changed)
+
+        # Also catches resolution and arrangement changes that keep the same set of screens.
+        # Handled on the next event loop turn so Qt has updated its own screen list first.
+        self.screen_observer = _NotificationObserver.alloc().initWithCallback_(
+            lambda notification: QTimer.singleShot(0, self.handle_screens_changed)
+        )
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self.screen_observer,
+            "handleNotification:",
+            NSApplicationDidChangeScreenParametersNotification,
+            None,
+        )
+
+    def create_blur_overlay(self):
+        if self.native_blur:
+            return NativeBlurOverlayGroup()
+        return QtBlurOverlay()
+
+    def watch_screen(self, screen):
+        screen.geometryChanged.connect(self.refresh_screens)
+        # Fires when the Dock or menu bar changes size or position
+        screen.availableGeometryChanged.connect(self.refresh_screens)
+
+    def handle_screen_added(self, screen):
+        self.blur_overlays[screen] = self.create_blur_overlay()
+        self.watch_screen(screen)
+        self.handle_screens_changed()
+
+    def handle_screen_removed(self, screen):
+        overlay = self.blur_overlays.pop(screen, None)
+        if overlay is not None:
+            overlay.hide()
+            overlay.close()
+        self.handle_screens_changed()
+
+    def handle_screens_changed(self, screen=None):
+        logger.info("Screen configuration changed, rebuilding coordinate mappers")
+        self.refresh_screens()
+        for overlay in self.blur_overlays.values():
+            overlay.refresh_mapper()
+
+        # Re-place the overlays against the new layout.
+        self.last_active_geometry = None
+        invalidate_window_cache()
+        self.check_for_window_changes()
+
+    def refresh_screens(self):
+        # Backs screen_at(), which replaces QApplication.screenAt on the hot path
+        screens = QApplication.screens()
+        self._screens = [(screen, screen.geometry()) for screen in screens]
+        self._available_geometries = {screen: screen.availableGeometry() for screen in screens}
+        self._last_screen = None
+
+    def screen_at(self, x, y):
+        # The focused window rarely changes screens, so try the last match first
+        if self._last_screen is not None and self._last_screen[1].contains(x, y):
+            return self._last_screen[0]
+
+        for entry in self._screens:
+            if entry[1].contains(x, y):
+                self._last_screen = entry
+                return entry[0]
+        return None
 
     def setup_system_tray(self):
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon(self.app)
 
         # Create a simple icon (colored square)
-        from PyQt6.QtGui import QPixmap
-
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(self.highlight_color))
-        self.tray_icon.setIcon(QIcon(pixmap))
+        self.tray_icon.setIcon(self.icon_for_color(self.highlight_qcolor))
 
         # Create tray menu
         tray_menu = QMenu()
@@ -385,145 +1022,331 @@ class FocusViewApp:
         self.tray_icon.show()
 
     def show_color_picker(self):
-        current_color = QColor(self.highlight_color)
-        color = QColorDialog.getColor(current_color, None, "Choose Highlight Color")
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog()
+            self._color_dialog.setWindowTitle("Choose Highlight Color")
+        elif self._color_dialog.isVisible():
+            self._color_dialog.raise_()
+            self._color_dialog.activateWindow()
+            return
+
+        self._color_dialog.setCurrentColor(self.highlight_qcolor)
+        # exec() returns 0 when the dialog is cancelled
+        if not self._color_dialog.exec():
+            return
 
+        color = self._color_dialog.selectedColor()
         if color.isValid():
-            self.highlight_color = color.name()
+            self.highlight_qcolor = color
             self.save_highlight_color()
             self.update_overlay_colors()
             self.update_tray_icon()
-            logger.info(f"Highlight color changed to: {self.highlight_color}")
+            logger.info(f"Highlight color changed to: {color.name()}")
 
     def save_highlight_color(self):
-        self.settings.setValue("highlight_color", self.highlight_color)
-        self.settings.sync()
+        # QSettings writes back on its own; no blocking sync() on the UI thread
+        self.settings.setValue("highlight_color", self.highlight_qcolor.name())
 
     def toggle_blur(self, checked: bool):
         self.blur_enabled = bool(checked)
         self.settings.setValue("blur_enabled", self.blur_enabled)
-        self.settings.sync()
         if not self.blur_enabled:
-            for overlay in self.blur_overlays.values():
-                overlay.hide()
+            self.hide_blur_overlays()
         else:
-            # Force refresh on next poll.
-            self.last_active_rect = None
+            # Forget the last geometry so the lookup below counts as a change and
+            # redraws; with AX events there may be no poll to pick it up otherwise.
+            self.last_active_geometry = None
+            self.check_for_window_changes()
 
     def update_overlay_colors(self):
-        for overlay in self.screen_overlays.values():
-            overlay.set_highlight_color(self.highlight_color)
+        self.border_overlay.set_highlight_color(self.highlight_qcolor)
 
     def update_tray_icon(self):
-        from PyQt6.QtGui import QPixmap
-
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(self.highlight_color))
-        self.tray_icon.setIcon(QIcon(pixmap))
+        self.tray_icon.setIcon(self.icon_for_color(self.highlight_qcolor))
+
+    def icon_for_color(self, color: QColor):
+        icon = self._icon_cache.get(color.name())
+        if icon is None:
+            if self._tray_pixmap is None:
+                self._tray_pixmap = QPixmap(32, 32)
+            # QIcon keeps its own copy, so refilling the pixmap later won't alter it
+            self._tray_pixmap.fill(color)
+            icon = QIcon(self._tray_pixmap)
+            self._icon_cache[color.name()] = icon
+        return icon
 
     def quit_app(self):
         logger.info("Quit requested from tray menu")
         self.cleanup()
         sys.exit(0)
 
+    def setup_geometry_poller(self):
+        # Window lookups can block for several ms, so they run off the UI thread
+        self._lookup_pending = False
+        self._lookup_again = False
+        self.geometry_poller = GeometryPoller()
+        self.poll_thread = QThread()
+        self.geometry_poller.moveToThread(self.poll_thread)
+        self.geometry_poller.requested.connect(self.geometry_poller.poll)
+        self.geometry_poller.geometry_ready.connect(self.handle_geometry_ready, Qt.ConnectionType.QueuedConnection)
+        self.poll_thread.start()
+
     def setup_timers(self):
-        # This timer will constantly check the active window's geometry
-        self.poll_timer.timeout.connect(self.check_for_window_changes)
-        self.poll_timer.start(100)  # Poll every 100ms
+        # Only started when window events cannot be observed via Accessibility.
+        # A coarse timer lets the system coalesce these wake-ups with other run loop work.
+        self.poll_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.poll_timer.timeout.connect(self.poll_for_window_changes)
 
         # This timer will only fire once after a delay, to show the border
         self.debounce_timer.setSingleShot(True)
         self.debounce_timer.timeout.connect(self.show_border_at_final_position)
 
+        self.ax_event_timer.setSingleShot(True)
+        self.ax_event_timer.setInterval(AX_EVENT_COALESCE_DELAY)
+        self.ax_event_timer.timeout.connect(self.check_for_window_changes)
+
+    def setup_window_observers(self):
+        # App switches come from NSWorkspace, window moves/resizes from Accessibility
+        self.workspace_observer = _NotificationObserver.alloc().initWithCallback_(self.handle_app_activated)
+        NSWorkspace.sharedWorkspace().notificationCenter().addObserver_selector_name_object_(
+            self.workspace_observer,
+            "handleNotification:",
+            NSWorkspaceDidActivateApplicationNotification,
+            None,
+        )
+        self.ax_observer = _AXWindowObserver(self.handle_window_event)
+        self.accessibility_trusted = check_accessibility()
+
+        frontmost_app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        if frontmost_app is not None:
+            set_active_pid(frontmost_app.processIdentifier())
+            self.observe_application(frontmost_app.processIdentifier())
+        else:
+            self.update_poll_fallback(False)
+        QTimer.singleShot(0, self.check_for_window_changes)
+
+    def observe_application(self, pid):
+        ax_active = self.accessibility_trusted and self.ax_observer.bind(pid)
+        self.update_poll_fallback(ax_active)
+
+    def update_poll_fallback(self, ax_active):
+        if ax_active:
+            if self.poll_timer.isActive():
+                logger.info("Accessibility events available, stopping fallback polling")
+                self.poll_timer.stop()
+        elif not self.poll_timer.isActive():
+            logger.info("Accessibility events unavailable, polling every %sms", FALLBACK_POLL_INTERVAL)
+            self._idle_ticks = 0
+            self.poll_timer.start(FALLBACK_POLL_INTERVAL)
+
+    def handle_app_activated(self, notification):
+        running_app = notification.userInfo()["NSWorkspaceApplicationKey"]
+        logger.debug("Application activated: %s", running_app.localizedName())
+        set_active_pid(running_app.processIdentifier())
+        # The app may have been activated by clicking a different one of its windows
+        forget_window_ids()
+        self.observe_application(running_app.processIdentifier())
+        self.reset_poll_interval()
+        self.check_for_window_changes()
+
+    def handle_window_event(self, notification):
+        logger.debug("Window event: %s", notification)
+        # The window just moved or resized, so a cached lookup is stale
+        invalidate_window_cache()
+        if notification in _AXWindowObserver.FOCUS_NOTIFICATIONS:
+            forget_window_ids()
+        # Leave the AX callback first; reposition panels from Qt's event loop.
+        # Not restarted while pending, so a continuous drag still updates every interval.
+        if not self.ax_event_timer.isActive():
+            self.ax_event_timer.start()
+
+    def poll_for_window_changes(self):
+        # Without AX events a focus change within the app is invisible, so always rescan
+        forget_window_ids()
+        self.check_for_window_changes()
+
+    def track_poll_activity(self, changed):
+        if changed:
+            self.reset_poll_interval()
+            return
+
+        self._idle_ticks += 1
+        for ticks, interval in POLL_BACKOFF_STEPS:
+            if self._idle_ticks == ticks:
+                logger.debug("No window changes for %s polls, polling every %sms", ticks, interval)
+                self.poll_timer.setInterval(interval)
+
+    def reset_poll_interval(self):
+        self._idle_ticks = 0
+        if self.poll_timer.interval() != FALLBACK_POLL_INTERVAL:
+            self.poll_timer.setInterval(FALLBACK_POLL_INTERVAL)
+
     def fade_overlay(self, overlay, start, end, duration=200):
-        # We store the animation as an instance variable to prevent it
-        # from being garbage-collected prematurely.
-        self.animation = QPropertyAnimation(overlay, b"windowOpacity")
-        self.animation.setStartValue(start)
-        self.animation.setEndValue(end)
-        self.animation.setDuration(duration)
-        self.animation.start()
+        animation = overlay.fade_animation
+        # Usually a no-op: hiding the overlay already stopped any earlier fade (BorderOverlay.hideEvent)
+        animation.stop()
+        overlay.setWindowOpacity(start)
+        animation.setStartValue(start)
+        animation.setEndValue(end)
+        animation.setDuration(duration)
+        animation.start()
 
     def check_for_window_changes(self):
-        active_window_geometry_dict = get_active_window_geometry()
-
-        current_rect = None
-        if active_window_geometry_dict:
-            current_rect = QRect(
-                active_window_geometry_dict["x"],
-                active_window_geometry_dict["y"],
-                active_window_geometry_dict["width"],
-                active_window_geometry_dict["height"],
-            )
+        # Coalesce: while a lookup is in flight, just ask for one more afterwards
+        if self._lookup_pending:
+            self._lookup_again = True
+            return
+
+        self._lookup_pending = True
+        self.geometry_poller.requested.emit()
+
+    def handle_geometry_ready(self, current_geometry):
+        self._lookup_pending = False
+        if self._lookup_again:
+            self._lookup_again = False
+            self.check_for_window_changes()
+
+        changed = current_geometry != self.last_active_geometry
+        if self.poll_timer.isActive():
+            self.track_poll_activity(changed)
 
         # Check if the window has moved, resized, or changed focus
-        if current_rect != self.last_active_rect:
-            self.last_active_rect = current_rect
+        if not changed:
+            return
 
-            # Instantly hide all borders to prevent jitter/artifacts
-            for overlay in self.screen_overlays.values():
-                overlay.hide()
+        previous_geometry = self.last_active_geometry
+        self.last_active_geometry = current_geometry
 
-            # Instantly hide blur overlays as well
-            for overlay in self.blur_overlays.values():
-                overlay.hide()
+        # Small shifts on the same screen just follow the window, no hide/fade cycle
+        if self.is_small_shift(previous_geometry, current_geometry):
+            self.follow_window(current_geometry)
+            return
 
-            # If there's an active window, start the timer to show the border
-            # after a short period of inactivity.
-            if current_rect:
-                self.debounce_timer.start(DEBOUNCE_DELAY)  # 150ms delay
+        # Instantly hide the border to prevent jitter/artifacts
+        self.border_overlay.hide()
+
+        # Instantly hide blur overlays as well
+        self.hide_blur_overlays()
+
+        # If there's an active window, start the timer to show the border
+        # after a short period of inactivity.
+        if current_geometry:
+            self.schedule_border()
+
+    def is_small_shift(self, previous_geometry, current_geometry):
+        # Only applies while the border is settled on screen
+        if not previous_geometry or not current_geometry or self.debounce_timer.isActive():
+            return False
+
+        # Plain tuple math; QRects are only built once overlays are actually moved
+        previous_x, previous_y = _geometry_center(previous_geometry)
+        current_x, current_y = _geometry_center(current_geometry)
+        if math.hypot(current_x - previous_x, current_y - previous_y) >= JITTER_THRESHOLD:
+            return False
+        return self.screen_at(current_x, current_y) == self.screen_at(previous_x, previous_y)
+
+    def follow_window(self, geometry):
+        active_rect = QRect(*geometry)
+        screen = self.screen_at(*_geometry_center(geometry))
+        if screen is not None:
+            self.border_overlay.setGeometry(active_rect)
+            self.show_blur(screen, active_rect)
+
+    def schedule_border(self):
+        # Trailing debounce, capped so a long drag still shows the border periodically
+        now = time.monotonic()
+        if not self.debounce_timer.isActive():
+            self._debounce_started_at = now
+        remaining = DEBOUNCE_MAX_WAIT - int((now - self._debounce_started_at) * 1000)
+        self.debounce_timer.start(max(0, min(DEBOUNCE_DELAY, remaining)))
 
     def show_border_at_final_position(self):
         # This method is called only when the window has stopped moving
-        if not self.last_active_rect:
+        if not self.last_active_geometry:
+            return
+
+        active_screen = self.screen_at(*_geometry_center(self.last_active_geometry))
+        if active_screen is None:
             return
 
-        active_screen = QApplication.screenAt(self.last_active_rect.center())
-
-        for screen, overlay in self.screen_overlays.items():
-            if screen == active_screen:
-                overlay.setGeometry(self.last_active_rect)
-                # Start transparent, show the widget, then fade it in.
-                overlay.setWindowOpacity(0.0)
-                overlay.show()
-                self.fade_overlay(overlay, 0.0, 1.0, duration=500)
-
-                if self.blur_enabled:
-                    blur_overlay = self.blur_overlays.get(screen)
-                    if blur_overlay:
-                        # Avoid covering the macOS menu bar / dock by using availableGeometry().
-                        blur_screen_rect = screen.availableGeometry()
-                        if BLUR_HOLE_PADDING:
-                            focus_rect = self.last_active_rect.adjusted(
-                                -BLUR_HOLE_PADDING,
-                                -BLUR_HOLE_PADDING,
-                                BLUR_HOLE_PADDING,
-                                BLUR_HOLE_PADDING,
-                            )
-                        else:
-                            focus_rect = self.last_active_rect
-                        blur_overlay.show_outside_rect(blur_screen_rect, focus_rect)
+        active_rect = QRect(*self.last_active_geometry)
+        self.border_overlay.setGeometry(active_rect)
+        # Set opacity to 0 and start the fade-in before showing, so no opaque frame is drawn first.
+        self.fade_overlay(self.border_overlay, 0.0, 1.0, duration=500)
+        self.border_overlay.show()
+
+        self.hide_blur_overlays(keep=active_screen)
+        self.show_blur(active_screen, active_rect)
+
+    def hide_blur_overlays(self, keep=None):
+        # One window server update for all screens instead of one per overlay
+        NSDisableScreenUpdates()
+        try:
+            for screen, overlay in self.blur_overlays.items():
+                if screen != keep:
+                    overlay.hide()
+        finally:
+            NSEnableScreenUpdates()
+
+    def show_blur(self, screen, active_rect):
+        if not self.blur_enabled:
+            return
+
+        blur_overlay = self.blur_overlays.get(screen)
+        if blur_overlay:
+            # Avoid covering the macOS menu bar / dock by using availableGeometry().
+            blur_screen_rect = self._available_geometries.get(screen) or screen.availableGeometry()
+            if BLUR_HOLE_PADDING:
+                focus_rect = active_rect.adjusted(
+                    -BLUR_HOLE_PADDING,
+                    -BLUR_HOLE_PADDING,
+                    BLUR_HOLE_PADDING,
+                    BLUR_HOLE_PADDING,
+                )
             else:
-                overlay.hide()
-                blur_overlay = self.blur_overlays.get(screen)
-                if blur_overlay:
-                    blur_overlay.hide()
+                focus_rect = active_rect
+            blur_overlay.show_outside_rect(blur_screen_rect, focus_rect)
 
     def cleanup(self):
+        # Reached from quit_app/signals and again from aboutToQuit via app.quit()
+        if getattr(self, "_cleaned_up", False):
+            return
+        self._cleaned_up = True
         logger.info("Cleaning up resources...")
         self.poll_timer.stop()
         self.debounce_timer.stop()
-        if self.animation:
-            self.animation.stop()
+        self.ax_event_timer.stop()
+        self._teardown_observers()
         if hasattr(self, "tray_icon"):
             self.tray_icon.hide()
-        for overlay in self.screen_overlays.values():
-            overlay.hide()
-            overlay.deleteLater()
+        if self.border_overlay is not None:
+            self.border_overlay.fade_animation.stop()
+            self.border_overlay.hide()
+            self.border_overlay.deleteLater()
         for overlay in self.blur_overlays.values():
             overlay.hide()
             overlay.close()
+        # Flush pending settings once, since we exit via sys.exit()
+        self.settings.sync()
         self.app.quit()
+        # Drain queued log records to disk before the process exits
+        if log_listener is not None:
+            log_listener.stop()
+
+    def _teardown_observers(self):
+        # Stop the lookup thread, release the App Nap activity and detach from macOS notifications
+        if hasattr(self, "poll_thread"):
+            self.poll_thread.quit()
+            self.poll_thread.wait()
+        if getattr(self, "app_nap_activity", None) is not None:
+            NSProcessInfo.processInfo().endActivity_(self.app_nap_activity)
+            self.app_nap_activity = None
+        if hasattr(self, "workspace_observer"):
+            NSWorkspace.sharedWorkspace().notificationCenter().removeObserver_(self.workspace_observer)
+        if hasattr(self, "screen_observer"):
+            NSNotificationCenter.defaultCenter().removeObserver_(self.screen_observer)
+        if hasattr(self, "ax_observer"):
+            self.ax_observer.unbind()
 
     def run(self):
         try:
@@ -535,6 +1358,7 @@ class FocusViewApp:
 
 
 def main():
+    setup_logging()
     app = FocusViewApp()
     app.run()
 